@@ -1,6 +1,9 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
 import argparse
+import multiprocessing
 
 from lyapunov_attractors import (
     ChaoticSystemFinder,
@@ -8,6 +11,12 @@ from lyapunov_attractors import (
     save_config,
     load_config
 )
+from lyapunov_attractors.visualizer import _init_worker, _animate_in_worker, system_digest
+
+# Animation workers running alongside the search. Kept small: the search already has
+# every core busy, and each worker is a whole process with its own numba/matplotlib.
+ANIMATION_WORKERS = 2
+
 
 def main(config_path: Path, animate: bool):
     """
@@ -19,7 +28,9 @@ def main(config_path: Path, animate: bool):
     1. Loads the configuration from the specified path or creates a default configuration if the file does not exist.
     2. Initializes the ChaoticSystemFinder with the loaded configuration.
     3. Processes the search attempts in 20 batches.
-    4. Optionally animates each found system if the animate flag is set to True.
+    4. Optionally animates each found system if the animate flag is set to True. Animations are
+       rendered on a process pool that lives for the whole run, so the search carries on meanwhile
+       and each system is only animated once.
     """
     if config_path.exists():
         print(f"Loading configuration from {config_path}")
@@ -32,20 +43,44 @@ def main(config_path: Path, animate: bool):
         print(f"Default configuration saved to {config_path}")
     finder = ChaoticSystemFinder(config)
 
-    # Process attempts in 20 batches
+    # Process attempts in 20 batches. These stay sequential on purpose: every search()
+    # already spreads its attempts over all cores via the prange kernel, so a process
+    # pool on top would only oversubscribe the CPU (and JIT-load once per worker).
+    # For the same reason the animation pool below only gets ANIMATION_WORKERS processes,
+    # just enough to keep videos encoding in the background while the search runs.
     attempts = config.max_attempts
     per_batch = attempts // 20
     print(f"Starting chaotic system search with 20 batches of {per_batch} attempts...")
 
-    for batch_num in range(20):
-        print(f"[ Batch {batch_num + 1} / 20 ]")
-        finder.search(num_attempts=per_batch)
-    
-        # Animate each found system (if we feel like it)
-        if animate:
-            for idx, system in enumerate(finder.best_systems, 1):
-                print(f"Animating system {idx} with Lyapunov exponent {system.lyapunov:.3f}")
-                finder.visualizer.animate_system(system, filename=f"attractor_animation_{system.timestamp}.mp4")
+    # Spawn, not fork: by now the prange kernel has started Numba's thread pool, and
+    # forked children of a threaded parent can leave the interpreter hung at exit
+    pool = (ProcessPoolExecutor(max_workers=ANIMATION_WORKERS,
+                                initializer=_init_worker,
+                                initargs=(Path("./best_attractors"),),
+                                mp_context=multiprocessing.get_context("spawn"))
+            if animate else nullcontext())
+    with pool:
+        animations = {}
+        for batch_num in range(20):
+            print(f"[ Batch {batch_num + 1} / 20 ]")
+            finder.search(num_attempts=per_batch)
+
+            # Animate each found system (if we feel like it)
+            if animate:
+                for idx, system in enumerate(finder.best_systems, 1):
+                    # Several systems can share a timestamp, so the hash keeps their videos apart
+                    digest = system_digest(system)
+                    if digest in animations:
+                        continue
+                    print(f"Animating system {idx} with Lyapunov exponent {system.lyapunov:.3f}")
+                    animations[digest] = pool.submit(
+                        _animate_in_worker, system,
+                        f"attractor_animation_{system.timestamp}_{digest}.mp4")
+
+        # Surface any errors from the workers
+        for future in animations.values():
+            future.result()
+    finder.visualizer.flush()
 
 def parse_args() -> argparse.Namespace:
     """
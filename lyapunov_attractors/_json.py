@@ -0,0 +1,39 @@
+"""
+JSON read/write helpers for the config and the stored systems.
+
+Uses orjson when it's installed (a good deal faster both ways), and the
+stdlib json module otherwise. Either way the files come out as 2-space
+indented JSON, so they stay interchangeable.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(obj: Any, filepath: str | Path):
+    """Write obj to filepath as JSON indented by 2 spaces."""
+    if orjson is not None:
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+
+
+def load_json(filepath: str | Path) -> Any:
+    """
+    Read JSON from filepath.
+
+    Raises:
+        JSONDecodeError: If the file contains invalid JSON (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
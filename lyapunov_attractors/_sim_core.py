@@ -0,0 +1,294 @@
+"""
+Numba-compiled kernels for the trajectory simulation hot loop.
+
+These are the only implementation of the trajectory step: polynomial map,
+magnitude cap and convergence/divergence check all run natively for the whole
+trajectory instead of bouncing back into Python on every iteration. The
+Lyapunov sum follows LyapunovCalculator.calculate, which is kept as the
+plain-NumPy reference for it.
+
+_simulate_batch fans many independent attempts out across cores with prange,
+so ChaoticSystemFinder.search doesn't have to loop over attempts in Python.
+
+Note: we deliberately don't use the blanket fastmath=True here. It implies
+'nnan' and 'ninf', which lets LLVM assume away the NaN/inf checks that the
+divergence test relies on. Everything else is fair game.
+
+If Numba isn't installed (e.g. a platform without an LLVM build), the same
+functions run as plain Python. Much slower, but the results are the same.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Early exit: once past the transient plus EARLY_EXIT_WARMUP steps, the running
+# exponent is checked every EARLY_EXIT_INTERVAL steps and the attempt is dropped
+# if it sits more than EARLY_EXIT_MARGIN below the threshold it has to beat.
+EARLY_EXIT_WARMUP = 500
+EARLY_EXIT_INTERVAL = 256
+EARLY_EXIT_MARGIN = 0.05
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _poly_eval(point, coeffs, d, quad_idx, out):
+    """
+    Evaluate the quadratic polynomial map for every output coordinate.
+
+    Args:
+        point (float64[:]): Current point, shape (d,).
+        coeffs (float64[:, :]): Coefficients, shape (d, coeffs_per_dim).
+        d (int): Number of dimensions.
+        quad_idx (int64[:, 2]): Index pairs for the quadratic terms.
+        out (float64[:]): Output buffer, shape (d,). Written in place.
+    """
+    if d == 3:
+        _poly_eval_d3(point, coeffs, out)
+        return
+
+    n_quad = quad_idx.shape[0]
+    for dim in range(d):
+        # Constant term
+        acc = coeffs[dim, 0] * 0.1
+        # Linear terms
+        for i in range(d):
+            acc += coeffs[dim, 1 + i] * point[i] * 0.5
+        # Quadratic terms
+        for k in range(n_quad):
+            acc += (coeffs[dim, 1 + d + k]
+                    * point[quad_idx[k, 0]] * point[quad_idx[k, 1]] * 0.25)
+        out[dim] = acc
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _poly_eval_d3(point, coeffs, out):
+    """
+    _poly_eval unrolled for the default 3D case (10 coefficients per dimension).
+
+    Quadratic term order matches combinations_with_replacement(range(3), 2):
+    xx, xy, xz, yy, yz, zz.
+    """
+    x0 = point[0]
+    x1 = point[1]
+    x2 = point[2]
+    l0 = x0 * 0.5
+    l1 = x1 * 0.5
+    l2 = x2 * 0.5
+    q00 = x0 * x0 * 0.25
+    q01 = x0 * x1 * 0.25
+    q02 = x0 * x2 * 0.25
+    q11 = x1 * x1 * 0.25
+    q12 = x1 * x2 * 0.25
+    q22 = x2 * x2 * 0.25
+    for dim in range(3):
+        out[dim] = (coeffs[dim, 0] * 0.1
+                    + coeffs[dim, 1] * l0 + coeffs[dim, 2] * l1 + coeffs[dim, 3] * l2
+                    + coeffs[dim, 4] * q00 + coeffs[dim, 5] * q01 + coeffs[dim, 6] * q02
+                    + coeffs[dim, 7] * q11 + coeffs[dim, 8] * q12 + coeffs[dim, 9] * q22)
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _normalize(point, d, max_density):
+    """Cap the magnitude of point at max_density in place and return the new magnitude."""
+    sq = 0.0
+    for i in range(d):
+        sq += point[i] * point[i]
+    magnitude = math.sqrt(sq)
+    # Branchless: scale is 1 whenever we're already under the cap, and a NaN
+    # magnitude stays NaN so the divergence check still catches it
+    scale = max_density / max(magnitude, max_density)
+    for i in range(d):
+        point[i] *= scale
+    return magnitude * scale
+
+
+@njit(cache=True, fastmath=FASTMATH)
+def _simulate(coeffs, x, xp, iters, d, skip_steps, renorm_steps, norm_dist,
+              extreme, conv, max_density, threshold, quad_idx, reference_traj):
+    """
+    Run the reference and perturbed trajectories for up to iters steps.
+
+    The Lyapunov exponent is accumulated on the fly (same maths as
+    LyapunovCalculator.calculate), so neither trajectory has to be kept around
+    just to score it. That also lets hopeless attempts bail out early: see
+    EARLY_EXIT_WARMUP and friends.
+
+    Args:
+        coeffs (float64[:, :]): Coefficients, shape (d, coeffs_per_dim).
+        x (float64[:]): Starting point of the reference trajectory.
+        xp (float64[:]): Starting point of the perturbed trajectory.
+        iters (int): Number of iterations to run.
+        d (int): Number of dimensions.
+        skip_steps (int): Transient steps skipped in the Lyapunov calculation.
+        renorm_steps (int): Number of steps between renormalizations.
+        norm_dist (float): Separation distance to renormalize back to.
+        extreme (float): Magnitude above which a trajectory counts as diverged.
+        conv (float): Magnitude below which a trajectory counts as converged.
+        max_density (float): Magnitude cap applied to every new point.
+        threshold (float): Exponent the attempt has to beat. Pass -inf to always
+            run the full iters steps.
+        quad_idx (int64[:, 2]): Index pairs for the quadratic terms.
+        reference_traj (float64[:, :]): Output buffer of shape (iters, d) for the
+            reference trajectory, or shape (0, d) to skip recording it.
+
+    Returns:
+        Tuple[int, float]: The number of reference points produced, and the
+        Lyapunov exponent (-inf if the run converged/diverged, exited early or had
+        no valid points).
+    """
+    record = reference_traj.shape[0] > 0
+    point = x.copy()
+    perturbed = xp.copy()
+    new_point = np.empty(d)
+    new_perturbed = np.empty(d)
+
+    # Skip the wibbly bits
+    start_idx = min(skip_steps, iters // 4)
+    check_from = start_idx + EARLY_EXIT_WARMUP
+    give_up_below = threshold - EARLY_EXIT_MARGIN
+    # log(separation / norm_dist) == log(separation) - log(norm_dist), so the
+    # division comes out of the loop and the bias is taken off once at the end
+    log_norm_dist = math.log(norm_dist)
+    lyap_sum = 0.0
+    valid_points = 0
+
+    for iteration in range(iters):
+        # Update reference trajectory
+        _poly_eval(point, coeffs, d, quad_idx, new_point)
+        magnitude = _normalize(new_point, d, max_density)
+        # Written this way round so NaN counts as diverged
+        if not (conv <= magnitude <= extreme):
+            return iteration, -np.inf
+        if record:
+            for i in range(d):
+                reference_traj[iteration, i] = new_point[i]
+
+        # Update perturbed trajectory
+        _poly_eval(perturbed, coeffs, d, quad_idx, new_perturbed)
+        magnitude = _normalize(new_perturbed, d, max_density)
+        if not (conv <= magnitude <= extreme):
+            return iteration + 1, -np.inf
+
+        sq = 0.0
+        for i in range(d):
+            diff = new_perturbed[i] - new_point[i]
+            sq += diff * diff
+        separation = math.sqrt(sq)
+
+        # Periodically renormalize the separation
+        if iteration % renorm_steps == 0 and iteration > 0 and separation > 0:
+            # Renormalize to initial separation distance
+            scale = norm_dist / separation
+            for i in range(d):
+                new_perturbed[i] = (new_point[i]
+                                    + (new_perturbed[i] - new_point[i]) * scale)
+            separation = norm_dist
+
+        # Ping-pong the buffers rather than copying the new points back
+        point, new_point = new_point, point
+        perturbed, new_perturbed = new_perturbed, perturbed
+
+        if iteration >= start_idx and separation > 0 and separation < extreme:
+            lyap_sum += math.log(separation)
+            valid_points += 1
+
+        # Not going to make the cut, don't bother finishing
+        if (iteration >= check_from and iteration % EARLY_EXIT_INTERVAL == 0
+                and valid_points > 0
+                and ((lyap_sum - valid_points * log_norm_dist)
+                     / (valid_points * renorm_steps)) < give_up_below):
+            return iteration + 1, -np.inf
+
+    if valid_points == 0:
+        return iters, -np.inf
+
+    # Calculate average over valid points and normalize by timestep
+    return iters, ((lyap_sum - valid_points * log_norm_dist)
+                   / (valid_points * renorm_steps))
+
+
+@njit(cache=True, parallel=True, fastmath=FASTMATH)
+def _simulate_batch(seeds, iters, d, coeffs_per_dim, param_max, min_density,
+                    max_density, skip_steps, renorm_steps, norm_dist, extreme,
+                    conv, threshold, quad_idx):
+    """
+    Run one attempt per seed in parallel and report the Lyapunov exponent of each.
+
+    Every attempt reseeds Numba's (per-thread) generator from its own seed before
+    drawing its coefficients and starting points, so results don't depend on
+    how prange splits the work.
+
+    Args:
+        seeds (uint32[:]): One seed per attempt.
+        iters (int): Number of iterations per attempt.
+        d (int): Number of dimensions.
+        coeffs_per_dim (int): Number of polynomial coefficients per dimension.
+        param_max (float): Coefficients are drawn from [-param_max / 2, param_max / 2].
+        min_density (float): Lower bound of the starting point range (halved).
+        max_density (float): Upper bound of the starting point range (halved),
+            and the magnitude cap applied to every new point.
+        skip_steps (int): Transient steps skipped in the Lyapunov calculation.
+        renorm_steps (int): Number of steps between renormalizations.
+        norm_dist (float): Initial/renormalized separation distance.
+        extreme (float): Magnitude above which a trajectory counts as diverged.
+        conv (float): Magnitude below which a trajectory counts as converged.
+        threshold (float): Exponent an attempt has to beat; attempts that clearly
+            won't are cut short and reported as -inf.
+        quad_idx (int64[:, 2]): Index pairs for the quadratic terms.
+
+    Returns:
+        Tuple[float64[:], float64[:, :, :], float64[:, :], float64[:, :]]: The
+        Lyapunov exponent of each attempt (-inf for converged/diverged ones), and
+        the coefficients, starting points and perturbed starting points that were
+        drawn for it, so interesting attempts can be replayed with _simulate.
+    """
+    n = seeds.shape[0]
+    out_lyap = np.empty(n)
+    out_coeffs = np.empty((n, d, coeffs_per_dim))
+    out_x = np.empty((n, d))
+    out_xp = np.empty((n, d))
+    # Nobody needs the trajectory of an attempt that's only being scored
+    no_record = np.empty((0, d))
+
+    for k in prange(n):
+        np.random.seed(seeds[k])
+
+        coeffs = out_coeffs[k]
+        for i in range(d):
+            for j in range(coeffs_per_dim):
+                coeffs[i, j] = np.random.uniform(-param_max / 2, param_max / 2)
+
+        x = out_x[k]
+        for i in range(d):
+            x[i] = np.random.uniform(min_density / 2, max_density / 2)
+
+        # Perturbed point with exact initial separation, in an isotropic direction
+        xp = out_xp[k]
+        sq = 0.0
+        for i in range(d):
+            xp[i] = np.random.standard_normal()
+            sq += xp[i] * xp[i]
+        magnitude = math.sqrt(sq)
+        for i in range(d):
+            xp[i] = x[i] + xp[i] * norm_dist / magnitude
+
+        _, lyapunov = _simulate(coeffs, x, xp, iters, d, skip_steps,
+                                renorm_steps, norm_dist, extreme, conv,
+                                max_density, threshold, quad_idx, no_record)
+        out_lyap[k] = lyapunov
+
+    return out_lyap, out_coeffs, out_x, out_xp
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from typing import List
 
-@dataclass
+import numpy as np
+
+# eq=False: a generated __eq__/__hash__ would choke on the points array and coefficients
+# list, so systems compare and hash by identity
+@dataclass(slots=True, frozen=True, eq=False)
 class AttractorSystem:
     """
     A class to represent a dynamical system for generating Lyapunov attractors.
@@ -12,7 +16,7 @@ class AttractorSystem:
         iterations (int): The number of iterations to run the system.
         coefficients (List[float]): The coefficients used in the system's equations.
         lyapunov (float): The Lyapunov exponent of the system.
-        points (List[List[float]]): The points generated by the system.
+        points (np.ndarray): The points generated by the system, shape (iterations, dimensions).
         timestamp (str): The timestamp when the system was created or last modified.
     """
     dimensions: int
@@ -20,6 +24,6 @@ class AttractorSystem:
     iterations: int
     coefficients: List[float]
     lyapunov: float
-    points: List[List[float]]
+    points: np.ndarray
     timestamp: str
 
@@ -1,17 +1,26 @@
-import os
+import sys
+import heapq
+import itertools
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 from pathlib import Path
 
+import numpy as np
 from colorama import Fore, Back, Style
 
 from lyapunov_attractors.attractor_system import AttractorSystem
 from lyapunov_attractors.storage_manager import StorageManager
-from lyapunov_attractors.lyapunov_calculator import LyapunovCalculator
 from lyapunov_attractors.trajectory_simulator import TrajectorySimulator
 from lyapunov_attractors.visualizer import Visualizer
 from lyapunov_attractors.models import ChaoticSysFinderConfig, LyapConfig
 
+# Attempts handed to the parallel kernel per call. Big enough to keep every core busy,
+# small enough that the progress line still moves.
+SEARCH_BATCH_SIZE = 256
+
+# ANSI clear screen + cursor home, so we don't fork a shell just to run cls/clear
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
 
 class ChaoticSystemFinder:
     """
@@ -20,16 +29,15 @@ class ChaoticSystemFinder:
     Attributes:
         config (ChaoticSysFinderConfig): Configuration for the chaotic system finder.
         storage_manager (StorageManager): Manages storage of the best attractor systems.
-        lyap_calculator (LyapunovCalculator): Calculates the Lyapunov exponent.
         simulator (TrajectorySimulator): Simulates the trajectory of systems.
         visualizer (Visualizer): Visualizes the attractor systems.
-        best_systems (List[AttractorSystem]): List of the best attractor systems found.
+        best_systems (List[AttractorSystem]): List of the best attractor systems found, best first.
 
     Methods:
         is_system_worthy(lyapunov: float) -> bool:
             Determines if a system is worthy of being stored based on its Lyapunov exponent.
 
-        add_system(coefficients: List[float], lyapunov: float, points: List[List[float]]):
+        add_system(coefficients: List[float], lyapunov: float, points: np.ndarray):
             Adds a new system to the list of best systems if it meets the criteria.
 
         search(num_attempts: int = None):
@@ -40,11 +48,35 @@ class ChaoticSystemFinder:
         self.config = config or ChaoticSysFinderConfig()
         self.lyap_config: LyapConfig = self.config.lyap_config
         self.storage_manager = StorageManager(self.config.output_path)
-        self.lyap_calculator = LyapunovCalculator(self.config.lyap_config)
-        self.simulator = TrajectorySimulator(config, self.lyap_calculator)
+        self.simulator = TrajectorySimulator(self.config)
         self.visualizer = Visualizer(Path("./best_attractors"))
-        self.best_systems: List[
-            AttractorSystem] = self.storage_manager.load_systems()
+
+        # Min-heap of (lyapunov, insertion order, system), so the weakest system is
+        # always at the top and ties never fall through to comparing systems
+        self._heap: List[Tuple[float, int, AttractorSystem]] = []
+        self._counter = itertools.count()
+        for system in self.storage_manager.load_systems():
+            heapq.heappush(self._heap, (system.lyapunov, next(self._counter), system))
+        while len(self._heap) > self.config.max_systems:
+            heapq.heappop(self._heap)
+        self._update_min_lyap()
+
+    @property
+    def best_systems(self) -> List[AttractorSystem]:
+        """The stored systems, sorted from highest to lowest Lyapunov exponent."""
+        return [system for _, _, system in sorted(self._heap, reverse=True)]
+
+    def _update_min_lyap(self):
+        """Cache the exponent a new system has to beat once the heap is full."""
+        if len(self._heap) < self.config.max_systems:
+            self._min_lyap = -np.inf
+        else:
+            self._min_lyap = self._heap[0][0]
+
+    @property
+    def current_threshold(self) -> float:
+        """The exponent a new system has to beat right now to be stored."""
+        return max(self.lyap_config.lyapunov_threshold, self._min_lyap)
 
     def is_system_worthy(self, lyapunov: float) -> bool:
         """
@@ -58,19 +90,17 @@ class ChaoticSystemFinder:
         """
         if lyapunov < self.lyap_config.lyapunov_threshold:
             return False
-        if len(self.best_systems) < self.config.max_systems:
-            return True
-        return lyapunov > min(system.lyapunov for system in self.best_systems)
+        return lyapunov > self._min_lyap
 
     def add_system(self, coefficients: List[float], lyapunov: float,
-                   points: List[List[float]]):
+                   points: np.ndarray):
         """
         Adds a new attractor system to the list of best systems if it meets the criteria.
 
         Args:
             coefficients (List[float]): The coefficients of the system.
             lyapunov (float): The Lyapunov exponent of the system.
-            points (List[List[float]]): The points representing the system's trajectory.
+            points (np.ndarray): The points representing the system's trajectory.
 
         Returns:
             None
@@ -87,11 +117,12 @@ class ChaoticSystemFinder:
             points=points,
             timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"))
 
-        self.best_systems.append(new_system)
-        self.best_systems.sort(key=lambda x: x.lyapunov, reverse=True)
-
-        if len(self.best_systems) > self.config.max_systems:
-            self.best_systems.pop()
+        entry = (lyapunov, next(self._counter), new_system)
+        if len(self._heap) < self.config.max_systems:
+            heapq.heappush(self._heap, entry)
+        else:
+            heapq.heappushpop(self._heap, entry)
+        self._update_min_lyap()
 
         self.storage_manager.save_systems(self.best_systems)
         self.visualizer.plot_system(new_system)
@@ -105,6 +136,9 @@ class ChaoticSystemFinder:
 
         Prints:
             Progress of the search attempts and details of any found systems with a Lyapunov exponent meeting the criteria.
+
+        Raises:
+            Exception: The first error hit while writing the PNG of a found system, once the search is done.
         """
         if num_attempts is None:
             num_attempts = self.config.max_attempts
@@ -114,16 +148,29 @@ class ChaoticSystemFinder:
         )
         print(f"Currently stored systems: {len(self.best_systems)}")
 
-        for attempt in range(num_attempts):
-            print(f"\r{Fore.MAGENTA}{Back.YELLOW}" +
-                  f"Attempt {attempt + 1}/{num_attempts}" +
-                  f"{Fore.RESET}{Back.RESET}",
-                  end="")
-
-            lyapunov, coefficients, points = self.simulator.simulate()
-
-            if lyapunov > self.lyap_config.lyapunov_threshold:
-                os.system('cls' if os.name == 'nt' else 'clear')
+        rng = np.random.default_rng()
+
+        for batch_start in range(0, num_attempts, SEARCH_BATCH_SIZE):
+            batch_size = min(SEARCH_BATCH_SIZE, num_attempts - batch_start)
+            sys.stdout.write(f"\r{Fore.MAGENTA}{Back.YELLOW}" +
+                             f"Attempt {batch_start + batch_size}/{num_attempts}" +
+                             f"{Fore.RESET}{Back.RESET}")
+            sys.stdout.flush()
+
+            seeds = rng.integers(0, 2**32, size=batch_size, dtype=np.uint32)
+            # Read once per batch; the bar only goes up as systems get added
+            threshold = self.current_threshold
+            lyaps, coef_mats, starts, perturbed_starts = self.simulator.simulate_batch(
+                seeds, threshold=threshold)
+
+            # Only the few promising attempts get replayed to capture their trajectory
+            for idx in np.flatnonzero(lyaps > threshold):
+                lyapunov, coefficients, points = self.simulator.simulate_from(
+                    coef_mats[idx], starts[idx], perturbed_starts[idx])
+                if lyapunov <= threshold:
+                    continue
+
+                print(CLEAR_SCREEN, end="")
                 print(
                     f"{Fore.LIGHTYELLOW_EX}" +
                     f"Found system with Lyapunov exponent: {lyapunov:.3f}" +
@@ -132,12 +179,15 @@ class ChaoticSystemFinder:
                 self.add_system(coefficients, lyapunov, points)
 
                 print("Current best systems:")
-                for idx, system in enumerate(self.best_systems, 1):
+                for rank, system in enumerate(self.best_systems, 1):
                     print(
-                        f"{idx}. " +
+                        f"{rank}. " +
                         f"{Fore.LIGHTYELLOW_EX}Lyapunov: {system.lyapunov:.3f}{Fore.RESET} "
                         +
                         f"(found: {Fore.CYAN}{system.timestamp}{Fore.RESET})\n"
                         +
                         f'{Fore.RED}C   {system.coefficients[0:system.param_count]}{Fore.RESET}\n'
                         + f'{Fore.BLUE}Vx  {system.points[0]}{Fore.RESET}\n')
+
+        # Make sure every plot of this search is on disk, and surface any write errors
+        self.visualizer.flush()
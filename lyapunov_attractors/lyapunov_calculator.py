@@ -1,5 +1,6 @@
 import math
-from typing import List
+
+import numpy as np
 
 from lyapunov_attractors.models import LyapConfig
 
@@ -7,6 +8,10 @@ class LyapunovCalculator:
     """
     A class to calculate the Lyapunov exponent for a given set of trajectories.
 
+    The search doesn't go through this: the _sim_core kernels accumulate the same sum on the
+    fly. It's the plain-NumPy reference for that maths, for scoring a recorded reference and
+    perturbed trajectory pair after the fact.
+
     Attributes:
         lyap_skip_steps (int): Number of initial steps to skip in the calculation.
         lyap_norm_dist (float): Normalization distance for the separation of trajectories.
@@ -14,7 +19,7 @@ class LyapunovCalculator:
         extreme_threshold (float): Threshold for extreme separation values.
 
     Methods:
-        calculate(reference_traj: List[List[float]], perturbed_traj: List[List[float]]) -> float:
+        calculate(reference_traj: np.ndarray, perturbed_traj: np.ndarray) -> float:
             Calculates the Lyapunov exponent based on the reference and perturbed trajectories.
     """
     def __init__(self, lyap_config: LyapConfig):
@@ -26,42 +31,37 @@ class LyapunovCalculator:
         """
         self.lyap_skip_steps = lyap_config.transient_skip_steps
         self.lyap_norm_dist = lyap_config.initial_distance
+        # Dividing by norm_dist inside the log is just this offset
+        self._log_norm_dist = math.log(self.lyap_norm_dist)
         self.lyap_renorm_steps = lyap_config.renorm_steps
         self.extreme_threshold = lyap_config.extreme_threshold
 
-    def calculate(self, reference_traj: List[List[float]], perturbed_traj: List[List[float]]) -> float:
+    def calculate(self, reference_traj: np.ndarray, perturbed_traj: np.ndarray) -> float:
         """
         Calculates the Lyapunov exponent based on the reference and perturbed trajectories.
 
         Args:
-            reference_traj (List[List[float]]): The reference trajectory points.
-            perturbed_traj (List[List[float]]): The perturbed trajectory points.
+            reference_traj (np.ndarray): The reference trajectory points, shape (iterations, dimensions).
+            perturbed_traj (np.ndarray): The perturbed trajectory points, shape (iterations, dimensions).
 
         Returns:
             float: The calculated Lyapunov exponent. Returns negative infinity if no valid points are found.
         """
-        lyap_sum = 0.0
         num_points = len(reference_traj)
-        valid_points = 0
 
         # Skip the wibbly bits
         start_idx = min(self.lyap_skip_steps, num_points // 4)
 
-        for i in range(start_idx, num_points):
-            ref_point = reference_traj[i]
-            pert_point = perturbed_traj[i]
-
-            # Check rms distance
-            separation = math.sqrt(
-                sum((r - p) ** 2 for r, p in zip(ref_point, pert_point))
-            )
-
-            if separation > 0 and separation < self.extreme_threshold:
-                lyap_sum += math.log(separation / self.lyap_norm_dist)
-                valid_points += 1
+        # Check rms distance
+        diff = reference_traj[start_idx:] - perturbed_traj[start_idx:]
+        separation = np.linalg.norm(diff, axis=1)
+        mask = (separation > 0) & (separation < self.extreme_threshold)
+        valid_points = int(mask.sum())
 
         if valid_points == 0:
             return float('-inf')
 
+        lyap_sum = np.log(separation[mask]).sum() - valid_points * self._log_norm_dist
+
         # Calculate average over valid points and normalize by timestep
-        return lyap_sum / (valid_points * self.lyap_renorm_steps)
+        return float(lyap_sum / (valid_points * self.lyap_renorm_steps))
@@ -1,5 +1,6 @@
 from collections import namedtuple
-import json
+
+from lyapunov_attractors._json import dump_json, load_json
 
 # Settings directly relating to Lyapunov calculation
 LyapConfig = namedtuple(
@@ -54,14 +55,12 @@ def save_config(config: ChaoticSysFinderConfig, filepath: str):
     # Can't forget the younglings
     config_dict["density_constraints"] = config.density_constraints._asdict()
     config_dict["lyap_config"] = config.lyap_config._asdict()
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(config_dict, f, indent=2)
+    dump_json(config_dict, filepath)
 
 
 def load_config(filepath: str) -> ChaoticSysFinderConfig:
     """Load configuration from a JSON file."""
-    with open(filepath, "r", encoding="utf-8") as f:
-        config_dict = json.load(f)
+    config_dict = load_json(filepath)
     # Instant namedtuples, just add water
     density_constraints = DensityConstraints(**config_dict["density_constraints"])
     lyap_config = LyapConfig(**config_dict["lyap_config"])
@@ -1,18 +1,23 @@
-import json
 from pathlib import Path
 from typing import List
-from dataclasses import asdict
+from dataclasses import fields
 
+import numpy as np
+
+from lyapunov_attractors._json import dump_json, load_json
 from lyapunov_attractors.attractor_system import AttractorSystem
 
 class StorageManager:
     """
     StorageManager is responsible for managing the storage of attractor systems.
-    It provides methods to load and save attractor systems from/to a JSON file.
+    It provides methods to load and save attractor systems from/to disk. The metadata of
+    each system goes in a JSON file, while the trajectories go in a compressed .npz archive
+    so thousands of floats don't have to be round-tripped through decimal strings.
 
     Attributes:
         storage_path (Path): The directory path where the systems file is stored.
-        systems_file (Path): The path to the JSON file where attractor systems are saved.
+        systems_file (Path): The path to the JSON file where attractor system metadata is saved.
+        points_file (Path): The path to the .npz archive where attractor system points are saved.
 
     Methods:
         load_systems() -> List[AttractorSystem]:
@@ -26,10 +31,14 @@ class StorageManager:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.systems_file = self.storage_path / "systems.json"
+        self.points_file = self.storage_path / "points.npz"
 
     def load_systems(self) -> List[AttractorSystem]:
         """
-        Loads previously saved attractor systems from a JSON file.
+        Loads previously saved attractor systems from the JSON file and points archive.
+
+        Files written before the points moved into the archive still load, with the
+        points read straight from the JSON.
 
         Returns:
             List[AttractorSystem]: A list of loaded attractor systems. If the file does not exist,
@@ -40,10 +49,19 @@ class StorageManager:
         """
         best_systems = []
         if self.systems_file.exists():
-            with open(self.systems_file, "r", encoding='utf-8') as f:
-                systems_data = json.load(f)
-                for system_dict in systems_data:
+            systems_data = load_json(self.systems_file)
+            archive = np.load(self.points_file) if self.points_file.exists() else {}
+            try:
+                for idx, system_dict in enumerate(systems_data):
+                    if "points" in system_dict:
+                        points = system_dict["points"]
+                    else:
+                        points = archive[self._points_key(idx)]
+                    system_dict["points"] = np.asarray(points, dtype=np.float64)
                     best_systems.append(AttractorSystem(**system_dict))
+            finally:
+                if hasattr(archive, "close"):
+                    archive.close()
             print(f"Loaded {len(best_systems)} previously saved systems.")
         else:
             print("No saved systems found.")
@@ -51,14 +69,28 @@ class StorageManager:
 
     def save_systems(self, systems: List[AttractorSystem]):
         """
-        Save a list of AttractorSystem objects to a JSON file.
+        Save a list of AttractorSystem objects to the JSON file and points archive.
 
         Args:
             systems (List[AttractorSystem]): A list of AttractorSystem objects to be saved.
 
-        The systems are serialized to JSON format and written to the file specified by self.systems_file.
-        Each AttractorSystem object is converted to a dictionary using the asdict function.
-        The JSON file is written with an indentation of 2 spaces for readability.
+        Every field except points is written to self.systems_file as JSON, indented by
+        2 spaces for readability. The points of each system are written to self.points_file
+        with np.savez_compressed, keyed by the system's position in the JSON list.
         """
-        with open(self.systems_file, "w", encoding='utf-8') as f:
-            json.dump([asdict(system) for system in systems], f, indent=2)
+        metadata = [
+            {field.name: getattr(system, field.name)
+             for field in fields(system) if field.name != "points"}
+            for system in systems
+        ]
+        np.savez_compressed(
+            self.points_file,
+            **{self._points_key(idx): system.points
+               for idx, system in enumerate(systems)},
+        )
+        dump_json(metadata, self.systems_file)
+
+    @staticmethod
+    def _points_key(idx: int) -> str:
+        """Name of the array holding the points of the idx-th saved system."""
+        return f"points_{idx}"
@@ -1,8 +1,10 @@
-import random
-import math
 import itertools
+import warnings
 from typing import List, Tuple
 
+import numpy as np
+
+from lyapunov_attractors._sim_core import _simulate, _simulate_batch
 from lyapunov_attractors.lyapunov_calculator import LyapunovCalculator
 
 from lyapunov_attractors.models import (
@@ -15,8 +17,9 @@ from lyapunov_attractors.models import (
 class TrajectorySimulator:
     """
     TrajectorySimulator is a class designed to simulate the trajectory of points in a chaotic system.
-    It generates random points, computes polynomial terms, normalizes points, checks for convergence,
-    and simulates the trajectory over a number of iterations.
+    It draws random coefficients and starting points, and runs the trajectories through the compiled
+    kernels in _sim_core, which evaluate the polynomial map, cap the point magnitude, check for
+    convergence/divergence and accumulate the Lyapunov exponent.
 
     Attributes:
         config (ChaoticSysFinderConfig): Configuration object containing various settings for the simulation.
@@ -33,27 +36,28 @@ class TrajectorySimulator:
         lyap_renorm_steps (int): Number of steps after which the separation is renormalized.
 
     Methods:
-        create_random_points() -> Tuple[List[float], List[float]]
-
-        generate_polynomial_coefficients() -> List[float]
-
-        compute_polynomial_terms(point: List[float], dim_coeffs: List[float]) -> float
+        create_random_points() -> Tuple[np.ndarray, np.ndarray]
 
-        normalize_point(point: List[float]) -> List[float]
+        generate_polynomial_coefficients() -> np.ndarray
 
-        check_convergence(point: List[float]) -> bool
+        simulate() -> Tuple[float, List[float], np.ndarray]
 
-        simulate() -> Tuple[float, List[float], List[List[float]]]
+        simulate_from(coef_mat: np.ndarray, point: np.ndarray, perturbed: np.ndarray) -> Tuple[float, List[float], np.ndarray]
 
-        calculate_new_point(point: List[float], coefficients: List[float]) -> List[float]
+        simulate_batch(seeds: np.ndarray, iterations: int | None = None, threshold: float = -inf) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
     """
 
     def __init__(self, config: ChaoticSysFinderConfig,
-                 lyc: LyapunovCalculator):
+                 lyc: LyapunovCalculator | None = None):
+        # The kernels score attempts themselves, so lyc is no longer used. Still accepted
+        # for now so callers written against TrajectorySimulator(config, lyc) keep working.
+        if lyc is not None:
+            warnings.warn("TrajectorySimulator no longer uses a LyapunovCalculator; "
+                          "the lyc argument is ignored and will be removed.",
+                          DeprecationWarning, stacklevel=2)
         self.config = config
         self.density_constraints: DensityConstraints = config.density_constraints
         self.lyap_config: LyapConfig = config.lyap_config
-        self.lyap_calc: LyapunovCalculator = lyc
         self.dimensions = config.dimensions
         self.iterations = config.iterations
         self.param_max = config.max_systems
@@ -63,8 +67,28 @@ class TrajectorySimulator:
         self.extreme_threshold = self.lyap_config.extreme_threshold
         self.lyap_norm_dist = self.lyap_config.initial_distance
         self.lyap_renorm_steps = self.lyap_config.renorm_steps
+        self._rng = np.random.default_rng()
+
+        # Polynomial layout per dimension: [constant, linear..., quadratic...]
+        self._coeffs_per_dim = (
+            1 + self.dimensions + (self.dimensions * (self.dimensions + 1)) // 2
+        )
+        # Index pairs for the quadratic terms, so we never walk itertools in the loop
+        self._quad_idx = np.array(
+            tuple(itertools.combinations_with_replacement(range(self.dimensions), 2)),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        # Get the JIT compile out of the way before the first real attempt
+        self._run_kernel(
+            np.zeros((self.dimensions, self._coeffs_per_dim)),
+            np.ones(self.dimensions),
+            np.ones(self.dimensions),
+            np.empty((1, self.dimensions)),
+        )
+        self.simulate_batch(np.zeros(1, dtype=np.uint32), iterations=1)
 
-    def create_random_points(self) -> Tuple[List[float], List[float]]:
+    def create_random_points(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generate a random point and a perturbed point with a specified initial separation.
 
@@ -73,25 +97,22 @@ class TrajectorySimulator:
         distance in a random direction.
 
         Returns:
-            Tuple[List[float], List[float]]: A tuple containing the original random point
+            Tuple[np.ndarray, np.ndarray]: A tuple containing the original random point
             and the perturbed point.
         """
-        point = [
-            random.uniform(self.min_density / 2, self.max_density / 2)
-            for _ in range(self.dimensions)
-        ]
-
-        # Create perturbed point with exact initial separation
-        random_direction = [random.uniform(-1, 1) for _ in range(self.dimensions)]
-        magnitude = math.sqrt(sum(x * x for x in random_direction))
-        perturbed = [
-            p + (d * self.lyap_norm_dist / magnitude)
-            for p, d in zip(point, random_direction)
-        ]
+        point = self._rng.uniform(
+            self.min_density / 2, self.max_density / 2, self.dimensions
+        )
+
+        # Create perturbed point with exact initial separation. Gaussian components
+        # give an isotropic direction, unlike a uniform cube which leans to the corners
+        random_direction = self._rng.standard_normal(self.dimensions)
+        magnitude = np.linalg.norm(random_direction)
+        perturbed = point + random_direction * (self.lyap_norm_dist / magnitude)
 
         return point, perturbed
 
-    def generate_polynomial_coefficients(self) -> List[float]:
+    def generate_polynomial_coefficients(self) -> np.ndarray:
         """
         Generates a list of polynomial coefficients for a given number of dimensions.
 
@@ -105,161 +126,126 @@ class TrajectorySimulator:
         -PARAM_MAX / 2 and PARAM_MAX / 2.
 
         Returns:
-            List[float]: A list of randomly generated polynomial coefficients.
+            np.ndarray: A flat array of randomly generated polynomial coefficients.
         """
-        coeffs_per_dim = (
-            1 + self.dimensions + (self.dimensions * (self.dimensions + 1)) // 2
+        total_params = self._coeffs_per_dim * self.dimensions
+        return self._rng.uniform(
+            -self.param_max / 2, self.param_max / 2, total_params
         )
-        total_params = coeffs_per_dim * self.dimensions
-        return [
-            random.uniform(-self.param_max / 2, self.param_max / 2)
-            for _ in range(total_params)
-        ]
-
-    def compute_polynomial_terms(
-        self, point: List[float], dim_coeffs: List[float]
-    ) -> float:
-        """
-        Computes the polynomial terms for a given point using the provided dimension coefficients.
-
-        This function calculates a polynomial value based on the given point and dimension coefficients.
-        It includes constant, linear, and quadratic terms.
 
-        Args:
-            point (List[float]): A list of float values representing the coordinates of the point.
-            dim_coeffs (List[float]): A list of float values representing the coefficients for the polynomial terms.
-
-        Returns:
-            float: The computed polynomial value. If an OverflowError occurs, returns float('inf').
-
-        Raises:
-            OverflowError: If the computation results in a value too large to be represented.
-        """
-        try:
-            current_idx = 0
-            result = 0.0
-
-            # Constant term
-            result += dim_coeffs[current_idx] * 0.1
-            current_idx += 1
-
-            # Linear terms
-            for i in range(self.dimensions):
-                if current_idx < len(dim_coeffs):
-                    result += dim_coeffs[current_idx] * point[i] * 0.5
-                    current_idx += 1
-
-            # Quadratic terms
-            for i, j in itertools.combinations_with_replacement(
-                range(self.dimensions), 2
-            ):
-                if current_idx < len(dim_coeffs):
-                    result += dim_coeffs[current_idx] * point[i] * point[j] * 0.25
-                    current_idx += 1
-
-            return result
-        except OverflowError:
-            return float("inf")  # Oopsiepoopsie, terms 2 stronk
-
-    def normalize_point(self, point: List[float]) -> List[float]:
+    def simulate(self) -> Tuple[float, List[float], np.ndarray]:
         """
-        Normalize a point to ensure its magnitude does not exceed a specified maximum density.
-
-        Args:
-            point (List[float]): A list of float values representing the coordinates of the point.
+        Simulates the trajectory of a point and its perturbed counterpart over a number of iterations.
 
         Returns:
-            List[float]: A list of float values representing the normalized coordinates of the point.
+            Tuple[float, List[float], np.ndarray]: A tuple containing:
+                - A float representing the Lyapunov exponent (returns -inf if convergence is detected).
+                - A list of polynomial coefficients used in the simulation.
+                - An array of shape (iterations, dimensions) holding the reference trajectory points.
         """
-        magnitude = math.sqrt(sum(x * x for x in point))
-        if magnitude > self.max_density:
-            return [x * self.max_density / magnitude for x in point]
-        return point
+        point, perturbed = self.create_random_points()
+        coef_mat = self.generate_polynomial_coefficients().reshape(
+            self.dimensions, self._coeffs_per_dim
+        )
+        return self.simulate_from(coef_mat, point, perturbed)
 
-    def check_convergence(self, point: List[float]) -> bool:
+    def simulate_from(
+        self, coef_mat: np.ndarray, point: np.ndarray, perturbed: np.ndarray
+    ) -> Tuple[float, List[float], np.ndarray]:
         """
-        Check if a given point has converged or diverged based on its magnitude.
+        Simulates the trajectories for the given coefficients and starting points.
+
+        This is what simulate() runs after drawing its random inputs, and is used to replay
+        promising attempts from simulate_batch() with their full trajectory.
 
         Args:
-            point (List[float]): A list of float values representing the coordinates of the point.
+            coef_mat (np.ndarray): The coefficients, shape (dimensions, coeffs_per_dim).
+            point (np.ndarray): Starting point of the reference trajectory.
+            perturbed (np.ndarray): Starting point of the perturbed trajectory.
 
         Returns:
-            bool: True if the magnitude of the point is greater than the extreme threshold
-                  or less than the convergence threshold, indicating divergence or convergence,
-                  respectively. False otherwise.
+            Tuple[float, List[float], np.ndarray]: Same as simulate().
         """
-        magnitude = math.sqrt(sum(x * x for x in point))
-        return (
-            magnitude > self.extreme_threshold or magnitude < self.convergence_threshold
+        coef_mat = np.ascontiguousarray(coef_mat, dtype=np.float64)
+        coefficients = coef_mat.ravel().tolist()
+        reference_traj = np.empty((self.iterations, self.dimensions))
+        num_points, lyapunov = self._run_kernel(
+            coef_mat,
+            np.asarray(point, dtype=np.float64),
+            np.asarray(perturbed, dtype=np.float64),
+            reference_traj,
         )
-
-    def simulate(self) -> Tuple[float, List[float], List[List[float]]]:
+        return lyapunov, coefficients, reference_traj[:num_points]
+
+    def simulate_batch(
+        self,
+        seeds: np.ndarray,
+        iterations: int | None = None,
+        threshold: float = -np.inf,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        Simulates the trajectory of a point and its perturbed counterpart over a number of iterations.
-
-        Returns:
-            Tuple[float, List[float], List[List[float]]]: A tuple containing:
-                - A float representing the Lyapunov exponent (returns -inf if convergence is detected).
-                - A list of polynomial coefficients used in the simulation.
-                - A list of lists representing the reference trajectory points.
-        """
-        point, perturbed = self.create_random_points()
-        coefficients = self.generate_polynomial_coefficients()
-        reference_traj = []
-        perturbed_traj = []
-
-        for iteration in range(self.iterations):
-            # Update reference trajectory
-            new_point = self.calculate_new_point(point, coefficients)
-            if self.check_convergence(new_point):
-                return float("-inf"), coefficients, reference_traj
-            point = new_point
-            reference_traj.append(point)
-
-            # Update perturbed trajectory
-            new_perturbed = self.calculate_new_point(perturbed, coefficients)
-            if self.check_convergence(new_perturbed):
-                return float("-inf"), coefficients, reference_traj
-
-            # Periodically renormalize the separation
-            if iteration % self.lyap_renorm_steps == 0 and iteration > 0:
-                # Calculate current separation vector
-                separation = [p - r for p, r in zip(new_perturbed, new_point)]
-                separation_dist = math.sqrt(sum(x * x for x in separation))
-
-                if separation_dist > 0:
-                    # Renormalize to initial separation distance
-                    scale = self.lyap_norm_dist / separation_dist
-                    new_perturbed = [
-                        r + s * scale for r, s in zip(new_point, separation)
-                    ]
-
-            perturbed = new_perturbed
-            perturbed_traj.append(perturbed)
-
-        lyapunov = self.lyap_calc.calculate(reference_traj, perturbed_traj)
-        return lyapunov, coefficients, reference_traj
-
-    def calculate_new_point(
-        self, point: List[float], coefficients: List[float]
-    ) -> List[float]:
-        """
-        Calculate a new point in the trajectory based on the given point and coefficients.
+        Runs one attempt per seed in parallel, without keeping any trajectories.
 
         Args:
-            point (List[float]): The current point in the trajectory, represented as a list of floats.
-            coefficients (List[float]): The coefficients used to compute the new point, represented as a list of floats.
+            seeds (np.ndarray): A uint32 array with one seed per attempt.
+            iterations (int, optional): Iterations per attempt. Defaults to the configured value.
+            threshold (float, optional): Exponent an attempt has to beat. Attempts whose running
+                exponent falls well short of it are cut short and reported as -inf.
+                Defaults to -inf, which runs every attempt to the end.
 
         Returns:
-            List[float]: The new point in the trajectory, normalized and represented as a list of floats.
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: A tuple containing:
+                - The Lyapunov exponent of each attempt (-inf if it converged or diverged).
+                - The coefficients of each attempt, shape (n, dimensions, coeffs_per_dim).
+                - The starting point of each attempt, shape (n, dimensions).
+                - The perturbed starting point of each attempt, shape (n, dimensions).
+            Pass an attempt's coefficients and starting points to simulate_from() to get its trajectory.
         """
-        new_point = []
-        coeffs_per_dim = len(coefficients) // self.dimensions
+        return _simulate_batch(
+            np.asarray(seeds, dtype=np.uint32),
+            int(self.iterations if iterations is None else iterations),
+            int(self.dimensions),
+            int(self._coeffs_per_dim),
+            float(self.param_max),
+            float(self.min_density),
+            float(self.max_density),
+            int(self.lyap_config.transient_skip_steps),
+            int(self.lyap_renorm_steps),
+            float(self.lyap_norm_dist),
+            float(self.extreme_threshold),
+            float(self.convergence_threshold),
+            float(threshold),
+            self._quad_idx,
+        )
 
-        for dim in range(self.dimensions):
-            start_idx = dim * coeffs_per_dim
-            dim_coeffs = coefficients[start_idx : start_idx + coeffs_per_dim]
-            new_coord = self.compute_polynomial_terms(point, dim_coeffs)
-            new_point.append(new_coord)
+    def _run_kernel(
+        self,
+        coef_mat: np.ndarray,
+        point: np.ndarray,
+        perturbed: np.ndarray,
+        reference_traj: np.ndarray,
+    ) -> Tuple[int, float]:
+        """
+        Run the compiled trajectory loop from _sim_core with this simulator's settings.
 
-        return self.normalize_point(new_point)
+        The reference trajectory is written into reference_traj, whose length sets the
+        number of iterations. Scalars are cast explicitly so every call hits the same
+        compiled specialization.
+        """
+        num_points, lyapunov = _simulate(
+            coef_mat,
+            point,
+            perturbed,
+            int(len(reference_traj)),
+            int(self.dimensions),
+            int(self.lyap_config.transient_skip_steps),
+            int(self.lyap_renorm_steps),
+            float(self.lyap_norm_dist),
+            float(self.extreme_threshold),
+            float(self.convergence_threshold),
+            float(self.max_density),
+            -np.inf,
+            self._quad_idx,
+            reference_traj,
+        )
+        return num_points, float(lyapunov)
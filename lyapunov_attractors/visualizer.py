@@ -1,12 +1,200 @@
+import hashlib
+import math
+import multiprocessing
+import queue
+import subprocess
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
+from lyapunov_attractors._sim_core import njit
 from lyapunov_attractors.attractor_system import AttractorSystem
 
+# VisPy is optional: with it, 3D plots are drawn by OpenGL in one go instead of
+# matplotlib placing every marker itself
+try:
+    from vispy import scene
+    from vispy.io import write_png
+except ImportError:
+    scene = None
+
+
+@lru_cache(maxsize=8)
+def get_cmap(name: str):
+    """plt.get_cmap, without going back to the colormap registry for every plot."""
+    return plt.get_cmap(name)
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse an AttractorSystem timestamp ("%Y%m%d_%H%M%S"), once per distinct timestamp."""
+    return datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
+
+
+def system_digest(system: AttractorSystem) -> str:
+    """
+    Short hex hash of a system's points and coefficients.
+
+    Timestamps only go down to the second and the search finds several systems per second,
+    so this is what tells their output files apart.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(np.ascontiguousarray(system.points, dtype=np.float64).tobytes())
+    digest.update(str(system.coefficients).encode())
+    return digest.hexdigest()
+
+
+# viridis sampled once, indexed per point rather than colormapped per point
+VIRIDIS_LUT = get_cmap('viridis')(np.linspace(0, 1, 256)).astype(np.float32)
+
+
+def time_colors(num_points: int) -> np.ndarray:
+    """
+    RGBA colours running through viridis from the first point to the last, shape (num_points, 4).
+
+    Handing these to scatter as-is means matplotlib never has to normalize and colormap
+    the points itself, not even on redraws.
+    """
+    lut_idx = np.linspace(0, len(VIRIDIS_LUT) - 1, num_points).astype(np.intp)
+    return VIRIDIS_LUT[lut_idx]
+
+
+def time_colorbar(num_points: int) -> ScalarMappable:
+    """Mappable for the 'Time Evolution' colorbar, since the scatters carry plain RGBA."""
+    return ScalarMappable(norm=Normalize(0, max(num_points - 1, 1)), cmap=get_cmap('viridis'))
+
+
+@njit(cache=True)
+def _subsample_bbox(points, stride):
+    """
+    Take every stride-th row of points as float32, and the per-column min/max of all rows, in one pass.
+
+    Args:
+        points (float64[:, :]): The points, shape (n, d), C-contiguous.
+        stride (int): Keep rows 0, stride, 2 * stride, ...
+
+    Returns:
+        Tuple[float32[:, :], float64[:], float64[:]]: The subsampled points, shape
+        (ceil(n / stride), d), and the minimum and maximum of each column.
+    """
+    n, d = points.shape
+    out = np.empty(((n + stride - 1) // stride, d), dtype=np.float32)
+    mins = np.full(d, np.inf)
+    maxs = np.full(d, -np.inf)
+    for i in range(n):
+        keep = i % stride == 0
+        for j in range(d):
+            value = points[i, j]
+            if value < mins[j]:
+                mins[j] = value
+            if value > maxs[j]:
+                maxs[j] = value
+            if keep:
+                out[i // stride, j] = value
+    return out, mins, maxs
+
+
+# Figure size, subplot margins and colorbar rect ([left, bottom, width, height], in figure
+# coordinates) per plot kind. The top margin leaves room for the multi-line title.
+PLOT_LAYOUTS = {
+    '3d': {
+        'figsize': (10, 8),
+        'margins': dict(left=0.05, right=0.95, bottom=0.16, top=0.64),
+        'colorbar': [0.1, 0.07, 0.8, 0.03],
+    },
+    '2d': {
+        'figsize': (10, 10),
+        'margins': dict(left=0.08, right=0.95, bottom=0.17, top=0.8),
+        'colorbar': [0.08, 0.06, 0.87, 0.025],
+    },
+}
+
+
+# ffmpeg output options per H.264 encoder
+ENCODER_ARGS = {
+    'h264_nvenc': ['-c:v', 'h264_nvenc', '-preset', 'p4', '-tune', 'hq', '-rc', 'vbr', '-cq', '23'],
+    'libx264': ['-c:v', 'libx264'],
+}
+
+
+@lru_cache(maxsize=1)
+def pick_encoder() -> str:
+    """
+    The H.264 encoder to animate with: NVENC if this ffmpeg has it and there's a GPU it can
+    actually open, libx264 otherwise. Only worked out once per process.
+    """
+    try:
+        encoders = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                  capture_output=True, text=True, check=True).stdout
+        if 'h264_nvenc' not in encoders:
+            return 'libx264'
+        # Being compiled in doesn't mean there's an NVIDIA GPU, so encode a test frame
+        probe = subprocess.run(['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                                '-f', 'lavfi', '-i', 'color=size=256x256',
+                                '-frames:v', '1', '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                               capture_output=True, check=False)
+    except (OSError, subprocess.CalledProcessError):
+        return 'libx264'
+    return 'h264_nvenc' if probe.returncode == 0 else 'libx264'
+
+
+def _png_writer(png_queue: queue.Queue, errors: list):
+    """
+    Background thread for Visualizer._save_png: write every queued (path, rgba, dpi) as a PNG.
+
+    Errors are collected for Visualizer.flush() to raise in the caller's thread.
+    """
+    while True:
+        path, rgba, dpi = png_queue.get()
+        try:
+            Image.fromarray(rgba).save(path, dpi=(dpi, dpi))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            png_queue.task_done()
+
+
+# Per-process Visualizer for the plot and animation pools, set up by _init_worker.
+# The pool helpers live here rather than in __main__ because spawned workers have to be
+# able to import them, and multiprocessing never re-imports a package's __main__.
+_worker_visualizer = None
+
+
+def _init_worker(*args):
+    """
+    Give a pool worker its own Agg-backed Visualizer(*args), so its figures get reused across jobs.
+    Workers have no window to show anything in.
+    """
+    global _worker_visualizer
+    matplotlib.use('Agg', force=True)
+    _worker_visualizer = Visualizer(*args)
+
+
+def _plot_in_worker(system: AttractorSystem):
+    """Plot one system on a worker set up by _init_worker."""
+    _worker_visualizer.plot_system(system)
+    # Pool workers exit without running atexit hooks, so don't leave the PNG queued
+    _worker_visualizer.flush()
+
+
+def _animate_in_worker(system: AttractorSystem, filename: str):
+    """Animate one system into filename on a worker set up by _init_worker."""
+    _worker_visualizer.animate_system(system, filename=filename)
+
 
 class Visualizer:
     """
@@ -14,6 +202,11 @@ class Visualizer:
 
     Attributes:
         storage_path (Path): The path where plots and animations will be saved.
+        dpi (int): Resolution of the saved PNGs.
+        tight_bbox (bool): Whether to crop the saved PNGs to their contents. This costs an extra
+            render pass per plot, so it's off by default.
+        cache (bool): Whether to name PNGs after a hash of the system's points and coefficients,
+            and skip plotting a system whose PNG already exists.
 
     Methods:
         __init__(storage_path: Path):
@@ -23,13 +216,37 @@ class Visualizer:
             Saves the plot as a PNG file in the specified storage path.
             If the system has fewer than 3 dimensions, it prints a message indicating that plotting is only implemented for 3D systems.
 
-        animate_system(system: AttractorSystem, filename: str = "attractor_animation.mp4", fps: int = 30):
-            Creates and saves an animation of the system's trajectory.
+        plot_systems(systems: Iterable[AttractorSystem], max_workers: int | None = None):
+            Plots many systems at once, spread over a pool of processes.
+
+        update_points(points: np.ndarray):
+            Shows the given points in a live 3D preview, reusing the same scatter on every call.
+
+        flush():
+            Waits for the PNGs that plot_system queued to be written. Also runs at exit.
+
+        animate_system(system: AttractorSystem, filename: str = "attractor_animation.mp4", fps: int = 30, max_seconds: float = 10):
+            Creates and saves an animation of the system's trajectory, at most max_seconds long.
             If the system has fewer than 3 dimensions, it prints a message indicating that animation is only implemented for 3D systems.
     """
 
-    def __init__(self, storage_path: Path):
+    def __init__(self, storage_path: Path, dpi: int = 150, tight_bbox: bool = False,
+                 cache: bool = True):
         self.storage_path = storage_path
+        self.dpi = dpi
+        self.tight_bbox = tight_bbox
+        self.cache = cache
+        # One reusable (figure, axes, colorbar) per plot kind, see _plot_canvas
+        self._plot_canvases = {}
+        # Live preview figure and its scatter, see update_points
+        self._preview = None
+        # Dropped to False if VisPy is installed but can't get an OpenGL context
+        self._use_vispy = scene is not None
+
+        # PNGs are encoded and written on a background thread, started by the first
+        # _save_png so a Visualizer that never plots (e.g. an animation worker) has none
+        self._png_queue = None
+        self._png_errors = []
 
     def plot_system(self, system: AttractorSystem):
         """
@@ -45,84 +262,268 @@ class Visualizer:
         None
 
         Saves the plot as a PNG file in the specified storage path if the system has 3 or more dimensions.
+        The PNG is written on a background thread; call flush() to wait for it.
         If the system has fewer than 3 dimensions, it prints a message indicating that plotting is only
         implemented for 3D systems.
+
+        3D systems are rendered with VisPy when it's available, and with matplotlib otherwise.
+        With caching on, a system whose PNG is already on disk isn't rendered again.
         """
-        points_array = np.array(system.points)
+        plot_path = self._plot_path(system)
+        if self.cache and plot_path.exists():
+            return
 
-        pretty_coefs = ",\n".join(", ".join(f"{system.coefficients[i+j]}"
-                                        for j in range(3))
-                              for i in range(0, len(system.coefficients), 3))
-        titleName = (
-            f'{system.dimensions}D: [{pretty_coefs}]' +
-            f'\nInitPos: {system.points[0]}' +
-            f'\nLyapunov: {system.lyapunov:.3f}' +
-            f'\nTime: {datetime.strptime(system.timestamp, "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M:%S")}'
-        )
+        points_array, mins, maxs = self._prepare_points(system)
+
+        # Build the title pieces up front, three coefficients per line
+        coefficients = system.coefficients
+        pretty_coefs = ",\n".join(", ".join(map(str, coefficients[i:i + 3]))
+                                  for i in range(0, len(coefficients), 3))
+        # From the stored points, so the title keeps full precision
+        init_pos = np.asarray(system.points[0])
+        found_at = parse_timestamp(system.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        titleName = (f'{system.dimensions}D: [{pretty_coefs}]'
+                     f'\nInitPos: {init_pos}'
+                     f'\nLyapunov: {system.lyapunov:.3f}'
+                     f'\nTime: {found_at}')
+
+        if system.dimensions >= 3 and self._use_vispy:
+            try:
+                self._plot_system_vispy(plot_path, points_array, titleName)
+                return
+            except RuntimeError as e:
+                # Typically no usable OpenGL backend, e.g. on a headless box
+                print(f"VisPy rendering unavailable ({e}), falling back to matplotlib.")
+                self._use_vispy = False
 
         if system.dimensions >= 3:
-            fig = plt.figure(figsize=(10, 8))
-            ax3d = fig.add_subplot(111, projection='3d')
-            scatter = ax3d.scatter(points_array[:, 0],
-                                   points_array[:, 1],
-                                   points_array[:, 2],
-                                   c=np.arange(len(points_array)),
-                                   cmap='viridis',
-                                   alpha=0.6)
-
-            ax3d.set_xlabel(
-                f'X \n[{min(points_array[:, 0]):.2f}, {max(points_array[:, 0]):.2f}]'
-            )
-            ax3d.set_ylabel(
-                f'Y \n[{min(points_array[:, 1]):.2f}, {max(points_array[:, 1]):.2f}]'
-            )
-            ax3d.set_zlabel(
-                f'Z \n[{min(points_array[:, 2]):.2f}, {max(points_array[:, 2]):.2f}]'
-            )
-            ax3d.set_title(titleName)
+            fig, ax3d = self._plot_canvas('3d', len(points_array))
+            ax3d.scatter(points_array[:, 0],
+                         points_array[:, 1],
+                         points_array[:, 2],
+                         c=time_colors(len(points_array)),
+                         alpha=0.6,
+                         rasterized=True)
 
-            plt.colorbar(scatter,
-                         label='Time Evolution',
-                         orientation='horizontal')
+            ax3d.set_xlabel(f'X \n[{mins[0]:.2f}, {maxs[0]:.2f}]')
+            ax3d.set_ylabel(f'Y \n[{mins[1]:.2f}, {maxs[1]:.2f}]')
+            ax3d.set_zlabel(f'Z \n[{mins[2]:.2f}, {maxs[2]:.2f}]')
+            ax3d.set_title(titleName)
 
-            plt.tight_layout()
-            plot_path = self.storage_path / f"attractor_{system.timestamp}.png"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._save_png(fig, plot_path)
         elif system.dimensions == 2:
-            fig, ax = plt.subplots(figsize=(10, 10))
-            scatter = ax.scatter(points_array[:, 0],
-                                 points_array[:, 1],
-                                 c=np.arange(len(points_array)),
-                                 cmap='viridis',
-                                 alpha=0.6)
+            fig, ax = self._plot_canvas('2d', len(points_array))
+            ax.scatter(points_array[:, 0],
+                       points_array[:, 1],
+                       c=time_colors(len(points_array)),
+                       alpha=0.6,
+                       rasterized=True)
 
             ax.set_xlabel('X')
             ax.set_ylabel('Y')
             ax.set_title(titleName)
 
-            plt.colorbar(scatter,
-                         label='Time Evolution',
-                         orientation='horizontal')
-
-            plt.tight_layout()
-            plot_path = self.storage_path / f"attractor_{system.timestamp}.png"
-            plt.savefig(plot_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            self._save_png(fig, plot_path)
         else:
             print("Plotting is only implemented for above 2D systems.")
 
+    def _plot_canvas(self, kind: str, num_points: int) -> tuple[Figure, plt.Axes]:
+        """
+        The figure and cleared axes to draw a '2d' or '3d' plot of num_points points on.
+
+        Each kind's figure, axes and colorbar are made on first use and kept for the life of
+        the Visualizer, so batch runs don't pay for figure setup on every plot. The figures
+        aren't registered with pyplot, so they never pile up there or pop up in plt.show().
+
+        The axes and colorbar get fixed positions (see PLOT_LAYOUTS) rather than a
+        tight_layout pass per plot, so a plot comes out the same whatever was drawn before it.
+        """
+        if kind not in self._plot_canvases:
+            layout = PLOT_LAYOUTS[kind]
+            fig = Figure(figsize=layout['figsize'], dpi=self.dpi)
+            fig.subplots_adjust(**layout['margins'])
+            if kind == '3d':
+                ax = fig.add_subplot(111, projection='3d')
+            else:
+                ax = fig.add_subplot(111)
+            colorbar = fig.colorbar(time_colorbar(num_points),
+                                    cax=fig.add_axes(layout['colorbar']),
+                                    label='Time Evolution',
+                                    orientation='horizontal')
+            FigureCanvasAgg(fig)
+            self._plot_canvases[kind] = (fig, ax, colorbar)
+            return fig, ax
+
+        fig, ax, colorbar = self._plot_canvases[kind]
+        ax.cla()
+        colorbar.update_normal(time_colorbar(num_points))
+        return fig, ax
+
+    def _save_png(self, fig: Figure, path: Path):
+        """
+        Render fig and queue its pixels to be written to path as a PNG in the background.
+
+        The figure gets reused for the next plot straight away, so the pixels are copied out.
+        Cropping to a tight bbox needs matplotlib's own savefig, so that case stays synchronous.
+        """
+        if self.tight_bbox:
+            fig.savefig(path, dpi=self.dpi, bbox_inches='tight')
+            return
+        fig.canvas.draw()
+        rgba = np.array(fig.canvas.buffer_rgba())
+        if self._png_queue is None:
+            self._png_queue = queue.Queue()
+            threading.Thread(target=_png_writer,
+                             args=(self._png_queue, self._png_errors),
+                             daemon=True).start()
+            # Drain the queue when self is collected, or at exit. Neither this nor the thread
+            # holds on to self, so a dropped Visualizer still goes away with its figures.
+            weakref.finalize(self, self._png_queue.join)
+        self._png_queue.put((path, rgba, self.dpi))
+
+    def flush(self):
+        """
+        Wait until every queued PNG has been written.
+
+        Raises:
+            Exception: The first error hit while writing a PNG since the last flush, if any.
+        """
+        if self._png_queue is None:
+            return
+        self._png_queue.join()
+        if self._png_errors:
+            error = self._png_errors[0]
+            self._png_errors.clear()
+            raise error
+
+    @staticmethod
+    def _prepare_points(system: AttractorSystem,
+                        stride: int = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every stride-th point of the system as a contiguous float32 array for rendering, plus the
+        min and max of each dimension over all points, all from one pass over the points.
+
+        Single precision is plenty for pixels and halves what matplotlib has to push through
+        its projection and drawing code.
+        """
+        points = np.ascontiguousarray(system.points, dtype=np.float64)
+        return _subsample_bbox(points, stride)
+
+    def plot_systems(self, systems: Iterable[AttractorSystem], max_workers: int | None = None):
+        """
+        Plot each of the given systems like plot_system, in parallel.
+
+        Rendering is CPU-bound and holds the GIL, so the systems are spread over a pool of
+        processes, each with its own Visualizer using these settings. The workers are spawned
+        rather than forked, since forking after Numba has started its thread pool (e.g. once
+        a search has run) can leave the interpreter hung at exit.
+
+        Args:
+            systems (Iterable[AttractorSystem]): The systems to plot.
+            max_workers (int, optional): Number of worker processes. Defaults to one per CPU.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(self.storage_path, self.dpi, self.tight_bbox, self.cache)) as pool:
+            # Drain the results so errors in the workers surface here
+            for _ in pool.map(_plot_in_worker, systems):
+                pass
+
+    def update_points(self, points: np.ndarray):
+        """
+        Show points (shape (n, 3+)) in a live 3D preview window.
+
+        The preview figure and its scatter are only made on the first call. After that the
+        existing Path3DCollection just gets new offsets and colours, so previewing a trajectory
+        as it evolves doesn't churn through a new artist every update.
+
+        Args:
+            points (np.ndarray): The points to show, coloured by their order like plot_system.
+        """
+        xyz = np.ascontiguousarray(points[:, :3])
+        if self._preview is None:
+            fig = plt.figure(figsize=(10, 8))
+            ax = fig.add_subplot(111, projection='3d')
+            ax.set_xlabel('X')
+            ax.set_ylabel('Y')
+            ax.set_zlabel('Z')
+            scatter = ax.scatter(xyz[:, 0], xyz[:, 1], xyz[:, 2],
+                                 c=time_colors(len(xyz)), alpha=0.6)
+            self._preview = (fig, ax, scatter)
+        else:
+            fig, ax, scatter = self._preview
+            scatter._offsets3d = (xyz[:, 0], xyz[:, 1], xyz[:, 2])
+            scatter.set_facecolor(time_colors(len(xyz)))
+
+        if len(xyz):
+            mins = xyz.min(axis=0)
+            maxs = xyz.max(axis=0)
+            ax.set_xlim(mins[0], maxs[0])
+            ax.set_ylim(mins[1], maxs[1])
+            ax.set_zlim(mins[2], maxs[2])
+        fig.canvas.draw_idle()
+
+    def _plot_path(self, system: AttractorSystem) -> Path:
+        """
+        Where plot_system saves the PNG for system.
+
+        With caching on, the name carries a hash of the points and coefficients, so a system
+        that's plotted again (e.g. a rerun with the same parameters) maps to the same file.
+        """
+        if not self.cache:
+            return self.storage_path / f"attractor_{system.timestamp}.png"
+        return self.storage_path / f"attractor_{system.timestamp}_{system_digest(system)}.png"
+
+    def _plot_system_vispy(self, plot_path: Path, points_array: np.ndarray, title: str):
+        """
+        Render the first three dimensions of a system off-screen with VisPy and save it to plot_path.
+
+        Raises:
+            RuntimeError: If VisPy has no backend that can provide an OpenGL context.
+        """
+        canvas = scene.SceneCanvas(show=False, bgcolor='white', size=(1000, 800))
+        try:
+            grid = canvas.central_widget.add_grid()
+            label = scene.Label(title, color='black', font_size=8)
+            label.height_max = 160
+            grid.add_widget(label, row=0, col=0)
+            view = grid.add_view(row=1, col=0)
+            view.camera = scene.TurntableCamera(elevation=30, azimuth=45)
+
+            xyz = np.ascontiguousarray(points_array[:, :3], dtype=np.float32)
+            colors = time_colors(len(xyz))
+            colors[:, 3] = 0.6
+
+            markers = scene.visuals.Markers(parent=view.scene)
+            markers.set_data(xyz, face_color=colors, edge_width=0, size=2)
+            view.camera.set_range()
+
+            write_png(str(plot_path), canvas.render())
+        finally:
+            canvas.close()
+
     def animate_system(self,
                        system: AttractorSystem,
                        filename: str = "attractor_animation.mp4",
-                       fps: int = 30):
-        """Create and save an animation of the system's trajectory."""
-        points_array = np.array(system.points)
-        sample_rate = 10  # Controls frame quantity
-        points_array = points_array[::sample_rate]
+                       fps: int = 30,
+                       max_seconds: float = 10):
+        """
+        Create and save an animation of the system's trajectory.
+
+        The trajectory is subsampled so the video runs for at most max_seconds at fps, whatever
+        the number of iterations: each frame adds one segment, so frames = points - 1.
+        """
+        target_frames = max(1, int(fps * max_seconds))
+        stride = max(1, math.ceil((len(system.points) - 1) / target_frames))
+        # The subsample comes out contiguous, so the segments below do too
+        points_array, mins, maxs = self._prepare_points(system, stride)
 
         if system.dimensions >= 3:
-            fig = plt.figure(figsize=(10, 8))
+            # A bare Agg figure: nothing to show on screen, and nothing left open in pyplot
+            # once the video is written
+            fig = Figure(figsize=(10, 8))
+            FigureCanvasAgg(fig)
             ax = fig.add_subplot(111, projection='3d')
 
             ax.set_xlabel('X')
@@ -132,26 +533,54 @@ class Visualizer:
                 f'3D Chaotic Attractor\nLyapunov Exponent: {system.lyapunov:.3f}'
             )
 
-            # store trajectory
-            line, = ax.plot([], [], [], lw=0.5)
-
             # Get a good seat
             ax.view_init(elev=30, azim=45)
 
-            def update(num):
-                line.set_data(points_array[:num, 0], points_array[:num, 1])
-                line.set_3d_properties(points_array[:num, 2])
-                return line,
+            # Every step of the trajectory as a (start, end) segment, shape (n - 1, 2, 3),
+            # allocated once. Frame n hands the collection a zero-copy view of the first n,
+            # so nothing gets re-sliced column by column or re-plotted per frame.
+            xyz = np.ascontiguousarray(points_array[:, :3])
+            segments = np.stack([xyz[:-1], xyz[1:]], axis=1)
+            trajectory = Line3DCollection(segments[:1], linewidths=0.5, colors='C0')
+            ax.add_collection3d(trajectory)
 
-            ani = FuncAnimation(fig,
-                                update,
-                                frames=len(points_array),
-                                blit=True,
-                                interval=20)
+            # The collection doesn't autoscale, so frame the whole trajectory up front
+            ax.set_xlim(mins[0], maxs[0])
+            ax.set_ylim(mins[1], maxs[1])
+            ax.set_zlim(mins[2], maxs[2])
 
+            # Draw each frame and pipe the raw pixels straight into ffmpeg, rather than
+            # going through matplotlib's animation writer
+            width, height = fig.canvas.get_width_height()
             anim_path = self.storage_path / filename
-            ani.save(anim_path, writer='ffmpeg', fps=fps)
-
-            plt.show()
+            with self._open_ffmpeg(anim_path, width, height, fps) as ffmpeg:
+                for num in range(1, len(segments) + 1):
+                    trajectory.set_segments(segments[:num])
+                    fig.canvas.draw()
+                    ffmpeg.stdin.write(fig.canvas.buffer_rgba())
+                ffmpeg.stdin.close()
+                if ffmpeg.wait() != 0:
+                    raise RuntimeError(f"ffmpeg failed with exit code {ffmpeg.returncode} writing {anim_path}")
         else:
             print("Animation is only implemented for 3D systems.")
+
+    @staticmethod
+    def _open_ffmpeg(path: Path, width: int, height: int, fps: int) -> subprocess.Popen:
+        """
+        Start an ffmpeg process that encodes raw RGBA frames written to its stdin into an H.264 video,
+        on the GPU when pick_encoder() finds NVENC.
+
+        The 1 MiB pipe buffer means a frame goes out in a handful of writes rather than many small ones.
+        """
+        return subprocess.Popen(
+            [
+                'ffmpeg', '-y', '-loglevel', 'error',
+                '-f', 'rawvideo', '-vcodec', 'rawvideo',
+                '-s', f'{width}x{height}', '-pix_fmt', 'rgba', '-r', str(fps),
+                '-i', '-',
+                *ENCODER_ARGS[pick_encoder()], '-pix_fmt', 'yuv420p',
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+            bufsize=1 << 20,
+        )
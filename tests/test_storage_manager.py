@@ -0,0 +1,85 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from lyapunov_attractors import AttractorSystem, StorageManager
+
+
+def make_system(lyapunov: float, seed: int) -> AttractorSystem:
+    """A small 3D system with random points, all found in the same second."""
+    rng = np.random.default_rng(seed)
+    return AttractorSystem(
+        dimensions=3,
+        param_count=12,
+        iterations=50,
+        coefficients=rng.uniform(-1, 1, 30).tolist(),
+        lyapunov=lyapunov,
+        points=rng.standard_normal((50, 3)),
+        timestamp="20260101_120000",
+    )
+
+
+class TestStorageManager(unittest.TestCase):
+    """Round trips through systems.json and points.npz."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.storage_path = Path(self._tmp.name)
+        self.storage = StorageManager(self.storage_path)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def assertSystemEqual(self, loaded: AttractorSystem, saved: AttractorSystem):
+        self.assertEqual(loaded.dimensions, saved.dimensions)
+        self.assertEqual(loaded.param_count, saved.param_count)
+        self.assertEqual(loaded.iterations, saved.iterations)
+        self.assertEqual(loaded.coefficients, saved.coefficients)
+        self.assertEqual(loaded.lyapunov, saved.lyapunov)
+        self.assertEqual(loaded.timestamp, saved.timestamp)
+        self.assertEqual(loaded.points.dtype, np.float64)
+        np.testing.assert_array_equal(loaded.points, saved.points)
+
+    def test_round_trip(self):
+        """Saved systems load back unchanged, even when they share a timestamp."""
+        systems = [make_system(0.2, 1), make_system(0.1, 2)]
+        self.storage.save_systems(systems)
+
+        self.assertTrue(self.storage.systems_file.exists())
+        self.assertTrue(self.storage.points_file.exists())
+        self.assertNotIn("points", self.storage.systems_file.read_text())
+
+        loaded = StorageManager(self.storage_path).load_systems()
+        self.assertEqual(len(loaded), len(systems))
+        for loaded_system, saved_system in zip(loaded, systems):
+            self.assertSystemEqual(loaded_system, saved_system)
+
+    def test_load_legacy_inline_points(self):
+        """A systems.json from before points.npz, with the points inline, still loads."""
+        system = make_system(0.3, 3)
+        legacy = {
+            "dimensions": system.dimensions,
+            "param_count": system.param_count,
+            "iterations": system.iterations,
+            "coefficients": system.coefficients,
+            "lyapunov": system.lyapunov,
+            "points": system.points.tolist(),
+            "timestamp": system.timestamp,
+        }
+        with open(self.storage.systems_file, "w") as f:
+            json.dump([legacy], f, indent=2)
+
+        loaded = self.storage.load_systems()
+        self.assertEqual(len(loaded), 1)
+        self.assertSystemEqual(loaded[0], system)
+
+    def test_load_missing(self):
+        """No systems.json means no systems."""
+        self.assertEqual(self.storage.load_systems(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
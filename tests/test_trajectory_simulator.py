@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from lyapunov_attractors import (
+    ChaoticSysFinderConfig,
+    LyapunovCalculator,
+    TrajectorySimulator,
+)
+from lyapunov_attractors._sim_core import _normalize, _poly_eval
+
+
+class TestTrajectorySimulator(unittest.TestCase):
+    """Checks the compiled kernels against each other and against LyapunovCalculator."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.config = ChaoticSysFinderConfig()
+        cls.simulator = TrajectorySimulator(cls.config)
+        cls.seeds = np.arange(32, dtype=np.uint32)
+        cls.batch = cls.simulator.simulate_batch(cls.seeds)
+
+    def test_batch_matches_replay(self):
+        """Replaying a batch attempt with simulate_from gives the exponent simulate_batch reported."""
+        lyaps, coef_mats, starts, perturbed_starts = self.batch
+        for idx in range(len(self.seeds)):
+            lyapunov, coefficients, points = self.simulator.simulate_from(
+                coef_mats[idx], starts[idx], perturbed_starts[idx])
+            np.testing.assert_allclose(lyapunov, lyaps[idx], rtol=1e-12)
+            self.assertEqual(coefficients, coef_mats[idx].ravel().tolist())
+
+    def test_kernel_exponent_matches_calculator(self):
+        """The exponent accumulated in the kernel matches LyapunovCalculator on the recorded trajectories."""
+        lyaps, coef_mats, starts, perturbed_starts = self.batch
+        idx = int(np.flatnonzero(np.isfinite(lyaps))[0])
+        lyap_config = self.config.lyap_config
+        dimensions = self.config.dimensions
+        max_density = float(self.simulator.max_density)
+        quad_idx = self.simulator._quad_idx
+
+        # Record both trajectories with the kernel's own step functions, renormalizing
+        # the perturbed one the same way _simulate does
+        reference = np.empty((self.config.iterations, dimensions))
+        perturbed = np.empty((self.config.iterations, dimensions))
+        point = starts[idx].copy()
+        perturbed_point = perturbed_starts[idx].copy()
+        for iteration in range(self.config.iterations):
+            new_point = np.empty(dimensions)
+            new_perturbed = np.empty(dimensions)
+            _poly_eval(point, coef_mats[idx], dimensions, quad_idx, new_point)
+            _normalize(new_point, dimensions, max_density)
+            _poly_eval(perturbed_point, coef_mats[idx], dimensions, quad_idx, new_perturbed)
+            _normalize(new_perturbed, dimensions, max_density)
+
+            separation = np.linalg.norm(new_perturbed - new_point)
+            if iteration % lyap_config.renorm_steps == 0 and iteration > 0 and separation > 0:
+                new_perturbed = (new_point + (new_perturbed - new_point)
+                                 * (lyap_config.initial_distance / separation))
+
+            reference[iteration] = new_point
+            perturbed[iteration] = new_perturbed
+            point, perturbed_point = new_point, new_perturbed
+
+        lyapunov, _, points = self.simulator.simulate_from(
+            coef_mats[idx], starts[idx], perturbed_starts[idx])
+        np.testing.assert_array_equal(points, reference)
+        expected = LyapunovCalculator(lyap_config).calculate(reference, perturbed)
+        np.testing.assert_allclose(lyapunov, expected, rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from lyapunov_attractors import AttractorSystem, Visualizer
+
+
+def make_system(dimensions: int, seed: int) -> AttractorSystem:
+    """A small system with random points and coefficients."""
+    rng = np.random.default_rng(seed)
+    coeffs_per_dim = 1 + dimensions + (dimensions * (dimensions + 1)) // 2
+    return AttractorSystem(
+        dimensions=dimensions,
+        param_count=12,
+        iterations=300,
+        coefficients=rng.uniform(-2, 2, coeffs_per_dim * dimensions).tolist(),
+        lyapunov=0.1 * seed,
+        points=rng.standard_normal((300, dimensions)),
+        timestamp=f"20260101_12000{seed}",
+    )
+
+
+class TestVisualizer(unittest.TestCase):
+    """Plots don't depend on what the reused figure drew before them."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def make_visualizer(self, name: str) -> Visualizer:
+        storage_path = self.tmp_path / name
+        storage_path.mkdir()
+        visualizer = Visualizer(storage_path)
+        # Compare matplotlib renders even where VisPy is installed
+        visualizer._use_vispy = False
+        return visualizer
+
+    def render(self, visualizer: Visualizer, system: AttractorSystem) -> np.ndarray:
+        visualizer.plot_system(system)
+        visualizer.flush()
+        return np.asarray(Image.open(visualizer._plot_path(system)))
+
+    def assertSameOnReusedFigure(self, dimensions: int):
+        system = make_system(dimensions, 1)
+        fresh = self.render(self.make_visualizer("fresh"), system)
+
+        reused = self.make_visualizer("reused")
+        for seed in (2, 3, 4):
+            self.render(reused, make_system(dimensions, seed))
+        np.testing.assert_array_equal(self.render(reused, system), fresh)
+
+    def test_3d_plot_independent_of_history(self):
+        self.assertSameOnReusedFigure(3)
+
+    def test_2d_plot_independent_of_history(self):
+        self.assertSameOnReusedFigure(2)
+
+
+if __name__ == "__main__":
+    unittest.main()